@@ -132,10 +132,14 @@ class Filtering(Cog):
             }
         }
 
-        self.bot.loop.create_task(self.reschedule_offensive_msg_deletion())
+        self.reschedule_task = self.bot.loop.create_task(
+            self.reschedule_offensive_msg_deletion(),
+            name="filtering-reschedule",
+        )
 
     def cog_unload(self) -> None:
         """Cancel scheduled tasks."""
+        self.reschedule_task.cancel()
         self.scheduler.cancel_all()
 
     def _get_filterlist_items(self, list_type: str, *, allowed: bool) -> list:
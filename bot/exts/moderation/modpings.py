@@ -1,8 +1,9 @@
 import datetime
 import logging
+from typing import Union
 
 from async_rediscache import RedisCache
-from dateutil.parser import isoparse
+from async_rediscache.types.base import RedisKeyType, namespace_lock
 from discord import Member
 from discord.ext.commands import Cog, Context, group, has_any_role
 
@@ -14,13 +15,30 @@ from bot.utils.scheduling import Scheduler
 log = logging.getLogger(__name__)
 
 
+class PingsOffCache(RedisCache):
+    """A `RedisCache` which can also delete multiple keys at once."""
+
+    @namespace_lock
+    async def delete_many(self, *keys: RedisKeyType) -> None:
+        """Delete all of `keys` from the cache with a single `HDEL`; keys that don't exist are ignored."""
+        if not keys:
+            return
+
+        typestring_keys = [self._key_to_typestring(key) for key in keys]
+
+        log.debug(f"Attempting to delete {len(typestring_keys)} keys from {self.namespace}.")
+        with await self._get_pool_connection() as connection:
+            await connection.hdel(self.namespace, *typestring_keys)
+
+
 class ModPings(Cog):
     """Commands for a moderator to turn moderator pings on and off."""
 
-    # RedisCache[discord.Member.id, 'Naïve ISO 8601 string']
+    # RedisCache[discord.Member.id, 'UTC POSIX timestamp']
     # The cache's keys are mods who have pings off.
-    # The cache's values are the times when the role should be re-applied to them, stored in ISO format.
-    pings_off_mods = RedisCache()
+    # The cache's values are the times when the role should be re-applied to them, stored as POSIX timestamps.
+    # Entries stored by older versions may still be naïve ISO 8601 strings.
+    pings_off_mods = PingsOffCache()
 
     def __init__(self, bot: Bot):
         self.bot = bot
@@ -38,23 +56,34 @@ class ModPings(Cog):
         self.moderators_role = self.guild.get_role(Roles.moderators)
 
         mod_team = self.guild.get_role(Roles.mod_team)
-        pings_on = self.moderators_role.members
         pings_off = await self.pings_off_mods.to_dict()
+        stale_entries = []
 
         log.trace("Applying the moderators role to the mod team where necessary.")
         for mod in mod_team.members:
-            if mod in pings_on:  # Make sure that on-duty mods aren't in the cache.
-                if mod in pings_off:
-                    await self.pings_off_mods.delete(mod.id)
+            if self.moderators_role in mod.roles:  # Make sure that on-duty mods aren't in the cache.
+                if mod.id in pings_off:
+                    stale_entries.append(mod.id)
                 continue
 
             # Keep the role off only for those in the cache.
+            # Re-apply it through the scheduler so the mods don't have to wait on each other's requests.
             if mod.id not in pings_off:
-                await self.reapply_role(mod)
+                self._role_scheduler.schedule(mod.id, self.reapply_role(mod))
             else:
-                expiry = isoparse(pings_off[mod.id]).replace(tzinfo=None)
+                expiry = self._expiry_from_cache(pings_off[mod.id])
                 self._role_scheduler.schedule_at(expiry, mod.id, self.reapply_role(mod))
 
+        # Remove all the stale entries in one round trip rather than one per mod.
+        await self.pings_off_mods.delete_many(*stale_entries)
+
+    @staticmethod
+    def _expiry_from_cache(value: Union[float, str]) -> datetime.datetime:
+        """Return the naïve UTC datetime stored as `value` in the pings off cache."""
+        if isinstance(value, str):  # Stored as an ISO 8601 string by an older version.
+            return datetime.datetime.fromisoformat(value).replace(tzinfo=None)
+        return datetime.datetime.utcfromtimestamp(value)
+
     async def reapply_role(self, mod: Member) -> None:
         """Reapply the moderator's role to the given moderator."""
         log.trace(f"Re-applying role to mod with ID {mod.id}.")
@@ -97,7 +126,7 @@ class ModPings(Cog):
         until_date = duration.replace(microsecond=0).isoformat()  # Looks noisy with microseconds.
         await mod.remove_roles(self.moderators_role, reason=f"Turned pings off until {until_date}.")
 
-        await self.pings_off_mods.set(mod.id, duration.isoformat())
+        await self.pings_off_mods.set(mod.id, duration.replace(tzinfo=datetime.timezone.utc).timestamp())
 
         # Allow rescheduling the task without cancelling it separately via the `on` command.
         if mod.id in self._role_scheduler:
@@ -111,7 +140,7 @@ class ModPings(Cog):
     async def on_command(self, ctx: Context) -> None:
         """Re-apply the pingable moderators role."""
         mod = ctx.author
-        if mod in self.moderators_role.members:
+        if self.moderators_role in mod.roles:
             await ctx.send(":question: You already have the role.")
             return
 
@@ -37,10 +37,11 @@ class Reminders(Cog):
         self.bot = bot
         self.scheduler = Scheduler(self.__class__.__name__)
 
-        self.bot.loop.create_task(self.reschedule_reminders())
+        self.reschedule_task = self.bot.loop.create_task(self.reschedule_reminders(), name="reminders-reschedule")
 
     def cog_unload(self) -> None:
         """Cancel scheduled tasks."""
+        self.reschedule_task.cancel()
         self.scheduler.cancel_all()
 
     async def reschedule_reminders(self) -> None:
@@ -5,7 +5,7 @@ import random
 import re
 from functools import partial
 from io import BytesIO
-from typing import List, Optional, Sequence, Union
+from typing import Collection, Dict, List, Optional, Sequence, Tuple, Union
 
 import discord
 from discord.errors import HTTPException
@@ -17,14 +17,26 @@ from bot.utils import scheduling
 
 log = logging.getLogger(__name__)
 
+MAX_CONCURRENT_UPLOADS = 4
+
+MODERATION_ROLE_IDS = frozenset(MODERATION_ROLES)
+
+# Seconds to wait for more disallowed reactions on a message before removing them all in one task.
+REACTION_REMOVAL_DELAY = 0.1
+
+# Reactions queued by `_queue_reaction_removal`, keyed by the ID of the message they were added to.
+_pending_removals: Dict[int, List[Tuple[Union[discord.Emoji, discord.PartialEmoji, str], discord.abc.User]]] = {}
+
+CLYDE_RE = re.compile(r"(clyd)(e)", flags=re.IGNORECASE)
+
 
 def reaction_check(
     reaction: discord.Reaction,
     user: discord.abc.User,
     *,
     message_id: int,
-    allowed_emoji: Sequence[str],
-    allowed_users: Sequence[int],
+    allowed_emoji: Collection[str],
+    allowed_users: Collection[int],
     allow_mods: bool = True,
 ) -> bool:
     """
@@ -33,32 +45,56 @@ def reaction_check(
     If the user is not allowed, remove the reaction. Ignore reactions made by the bot.
     If `allow_mods` is True, allow users with moderator roles even if they're not in `allowed_users`.
     """
-    right_reaction = (
-        user != bot.instance.user
-        and reaction.message.id == message_id
-        and str(reaction.emoji) in allowed_emoji
-    )
-    if not right_reaction:
+    # Cheapest checks first, as this is called for every reaction added while waiting.
+    if reaction.message.id != message_id or user.id == bot.instance.user.id:
         return False
 
-    is_moderator = (
-        allow_mods
-        and any(role.id in MODERATION_ROLES for role in getattr(user, "roles", []))
-    )
+    # Unicode emoji already are strings; only custom emoji need to be formatted.
+    emoji = reaction.emoji
+    if (emoji if isinstance(emoji, str) else str(emoji)) not in allowed_emoji:
+        return False
 
-    if user.id in allowed_users or is_moderator:
+    if user.id in allowed_users or (allow_mods and _is_moderator(user)):
         log.trace(f"Allowed reaction {reaction} by {user} on {reaction.message.id}.")
         return True
     else:
         log.trace(f"Removing reaction {reaction} by {user} on {reaction.message.id}: disallowed user.")
-        scheduling.create_task(
-            reaction.message.remove_reaction(reaction.emoji, user),
-            HTTPException,  # Suppress the HTTPException if adding the reaction fails
-            name=f"remove_reaction-{reaction}-{reaction.message.id}-{user}"
-        )
+        _queue_reaction_removal(reaction, user)
         return False
 
 
+def _queue_reaction_removal(reaction: discord.Reaction, user: discord.abc.User) -> None:
+    """Queue `reaction` by `user` for removal, starting a task to remove the message's queued reactions if needed."""
+    message = reaction.message
+
+    if message.id in _pending_removals:
+        # A task is already waiting to remove this message's reactions; just add to its queue.
+        _pending_removals[message.id].append((reaction.emoji, user))
+        return
+
+    _pending_removals[message.id] = [(reaction.emoji, user)]
+    scheduling.create_task(_remove_reactions(message), name=f"remove_reactions-{message.id}")
+
+
+async def _remove_reactions(message: discord.Message) -> None:
+    """Remove the reactions queued for `message` once `REACTION_REMOVAL_DELAY` seconds have passed."""
+    try:
+        await asyncio.sleep(REACTION_REMOVAL_DELAY)
+    finally:
+        # Always take the queue, so a cancelled task doesn't leave reactions queued with no task to remove them.
+        removals = _pending_removals.pop(message.id)
+
+    for emoji, user in removals:
+        log.trace(f"Removing reaction {emoji} by {user} on {message.id}.")
+        with contextlib.suppress(HTTPException):  # Suppress the HTTPException if removing the reaction fails
+            await message.remove_reaction(emoji, user)
+
+
+def _is_moderator(user: discord.abc.User) -> bool:
+    """Return True if `user` is a member with any of the roles in `MODERATION_ROLES`."""
+    return isinstance(user, discord.Member) and any(role.id in MODERATION_ROLE_IDS for role in user.roles)
+
+
 async def wait_for_deletion(
     message: discord.Message,
     user_ids: Sequence[int],
@@ -89,8 +125,8 @@ async def wait_for_deletion(
     check = partial(
         reaction_check,
         message_id=message.id,
-        allowed_emoji=deletion_emojis,
-        allowed_users=user_ids,
+        allowed_emoji=frozenset(map(str, deletion_emojis)),
+        allowed_users=frozenset(user_ids),
         allow_mods=allow_mods,
     )
 
@@ -112,6 +148,9 @@ async def send_attachments(
     Each attachment is sent as a separate message to more easily comply with the request/file size
     limit. If link_large is True, attachments which are too large are instead grouped into a single
     embed which links to them. Extra kwargs will be passed to send() when sending the attachment.
+
+    Up to `MAX_CONCURRENT_UPLOADS` attachments are re-uploaded at once, so the messages may not be
+    sent in the original order. The returned URLs are always in the original order.
     """
     webhook_send_kwargs = {
         'username': message.author.display_name,
@@ -120,9 +159,11 @@ async def send_attachments(
     webhook_send_kwargs.update(kwargs)
     webhook_send_kwargs['username'] = sub_clyde(webhook_send_kwargs['username'])
 
-    large = []
-    urls = []
-    for attachment in message.attachments:
+    # Limit how many attachments are being re-uploaded at once to go easy on the rate limits.
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_UPLOADS)
+
+    async def upload(attachment: discord.Attachment) -> Tuple[Optional[str], Optional[discord.Attachment]]:
+        """Re-upload `attachment`; return its new URL if it has one, and `attachment` if it should be linked."""
         failure_msg = (
             f"Failed to re-upload attachment {attachment.filename} from message {message.id}"
         )
@@ -132,25 +173,33 @@ async def send_attachments(
             # This should avoid most files that are too large,
             # but some may get through hence the try-catch.
             if attachment.size <= destination.guild.filesize_limit - 512:
-                with BytesIO() as file:
-                    await attachment.save(file, use_cached=use_cached)
-                    attachment_file = discord.File(file, filename=attachment.filename)
-
-                    if isinstance(destination, discord.TextChannel):
-                        msg = await destination.send(file=attachment_file, **kwargs)
-                        urls.append(msg.attachments[0].url)
-                    else:
-                        await destination.send(file=attachment_file, **webhook_send_kwargs)
+                async with semaphore:
+                    # Wrap the downloaded bytes directly rather than writing them into an empty buffer.
+                    # BytesIO shares the initial bytes until written to, so the file isn't held in memory twice.
+                    with BytesIO(await attachment.read(use_cached=use_cached)) as file:
+                        attachment_file = discord.File(file, filename=attachment.filename)
+
+                        if isinstance(destination, discord.TextChannel):
+                            msg = await destination.send(file=attachment_file, **kwargs)
+                            return msg.attachments[0].url, None
+                        else:
+                            await destination.send(file=attachment_file, **webhook_send_kwargs)
             elif link_large:
-                large.append(attachment)
+                return None, attachment
             else:
                 log.info(f"{failure_msg} because it's too large.")
         except HTTPException as e:
             if link_large and e.status == 413:
-                large.append(attachment)
+                return None, attachment
             else:
                 log.warning(f"{failure_msg} with status {e.status}.", exc_info=e)
 
+        return None, None
+
+    results = await asyncio.gather(*(upload(attachment) for attachment in message.attachments))
+    urls = [url for url, _ in results if url]
+    large = [attachment for _, attachment in results if attachment]
+
     if link_large and large:
         desc = "\n".join(f"[{attachment.filename}]({attachment.url})" for attachment in large)
         embed = discord.Embed(description=desc)
@@ -171,22 +220,21 @@ def sub_clyde(username: Optional[str]) -> Optional[str]:
     Discord disallows "clyde" anywhere in the username for webhooks. It will return a 400.
     Return None only if `username` is None.
     """
-    def replace_e(match: re.Match) -> str:
-        char = "е" if match[2] == "e" else "Е"
-        return match[1] + char
-
     if username:
-        return re.sub(r"(clyd)(e)", replace_e, username, flags=re.I)
+        return CLYDE_RE.sub(_replace_clyde_e, username)
     else:
         return username  # Empty string or None
 
 
+def _replace_clyde_e(match: re.Match) -> str:
+    """Return the matched "clyd" followed by the Cyrillic counterpart of the matched "e"/"E"."""
+    char = "е" if match[2] == "e" else "Е"
+    return match[1] + char
+
+
 async def send_denial(ctx: Context, reason: str) -> discord.Message:
     """Send an embed denying the user with the given reason."""
-    embed = discord.Embed()
-    embed.colour = discord.Colour.red()
-    embed.title = random.choice(NEGATIVE_REPLIES)
-    embed.description = reason
+    embed = discord.Embed(colour=discord.Colour.red(), title=random.choice(NEGATIVE_REPLIES), description=reason)
 
     return await ctx.send(embed=embed)
 
@@ -1,11 +1,17 @@
 import asyncio
 import contextlib
+import heapq
 import inspect
+import itertools
 import logging
+import time
 import typing as t
 from datetime import datetime
 from functools import partial
 
+# Timers due within this many seconds of the loop's time are run, the same way asyncio's own loop does.
+CLOCK_RESOLUTION = time.get_clock_info("monotonic").resolution
+
 
 class Scheduler:
     """
@@ -21,6 +27,9 @@ class Scheduler:
     the same ID used to schedule it.  The `in` operator is supported for checking if a task with a
     given ID is currently scheduled.
 
+    Coroutines scheduled in the future are kept in a heap ordered by when they're due, and a single
+    event loop timer is used to start the Tasks of all of them once their time comes.
+
     Any exception raised in a scheduled task is logged when the task is done.
     """
 
@@ -30,9 +39,17 @@ class Scheduler:
         self._log = logging.getLogger(f"{__name__}.{name}")
         self._scheduled_tasks: t.Dict[t.Hashable, asyncio.Task] = {}
 
+        # Coroutines that aren't due yet, as (sequence number, coroutine) pairs keyed by their task IDs.
+        self._delayed: t.Dict[t.Hashable, t.Tuple[int, t.Coroutine]] = {}
+        # A heap of (loop time, sequence number, task ID) for the delayed coroutines.
+        # Entries of cancelled coroutines are left in and skipped once they're popped.
+        self._heap: t.List[t.Tuple[float, int, t.Hashable]] = []
+        self._sequence = itertools.count()
+        self._timer: t.Optional[asyncio.TimerHandle] = None
+
     def __contains__(self, task_id: t.Hashable) -> bool:
         """Return True if a task with the given `task_id` is currently scheduled."""
-        return task_id in self._scheduled_tasks
+        return task_id in self._scheduled_tasks or task_id in self._delayed
 
     def schedule(self, task_id: t.Hashable, coroutine: t.Coroutine) -> None:
         """
@@ -43,19 +60,10 @@ class Scheduler:
         """
         self._log.trace(f"Scheduling task #{task_id}...")
 
-        msg = f"Cannot schedule an already started coroutine for #{task_id}"
-        assert inspect.getcoroutinestate(coroutine) == "CORO_CREATED", msg
-
-        if task_id in self._scheduled_tasks:
-            self._log.debug(f"Did not schedule task #{task_id}; task was already scheduled.")
-            coroutine.close()
+        if self._reject_coroutine(task_id, coroutine):
             return
 
-        task = asyncio.create_task(coroutine, name=f"{self.name}_{task_id}")
-        task.add_done_callback(partial(self._task_done_callback, task_id))
-
-        self._scheduled_tasks[task_id] = task
-        self._log.debug(f"Scheduled task #{task_id} {id(task)}.")
+        self._start_task(task_id, coroutine)
 
     def schedule_at(self, time: datetime, task_id: t.Hashable, coroutine: t.Coroutine) -> None:
         """
@@ -72,9 +80,9 @@ class Scheduler:
         now_datetime = datetime.now(time.tzinfo) if time.tzinfo else datetime.utcnow()
         delay = (time - now_datetime).total_seconds()
         if delay > 0:
-            coroutine = self._await_later(delay, task_id, coroutine)
-
-        self.schedule(task_id, coroutine)
+            self.schedule_later(delay, task_id, coroutine)
+        else:
+            self.schedule(task_id, coroutine)
 
     def schedule_later(self, delay: t.Union[int, float], task_id: t.Hashable, coroutine: t.Coroutine) -> None:
         """
@@ -83,12 +91,38 @@ class Scheduler:
         If a task with `task_id` already exists, close `coroutine` instead of scheduling it. This
         prevents unawaited coroutine warnings. Don't pass a coroutine that'll be re-used elsewhere.
         """
-        self.schedule(task_id, self._await_later(delay, task_id, coroutine))
+        self._log.trace(f"Scheduling task #{task_id} to be awaited in {delay} seconds...")
+
+        if self._reject_coroutine(task_id, coroutine):
+            return
+
+        loop = asyncio.get_running_loop()
+        sequence = next(self._sequence)
+
+        self._delayed[task_id] = (sequence, coroutine)
+        heapq.heappush(self._heap, (loop.time() + delay, sequence, task_id))
+
+        # Only the earliest coroutine needs the timer, so re-arm it only if this one became the earliest.
+        if self._heap[0][1] == sequence:
+            self._arm_timer(loop)
+
+        self._log.debug(f"Scheduled task #{task_id} to be awaited in {delay} seconds.")
 
     def cancel(self, task_id: t.Hashable) -> None:
         """Unschedule the task identified by `task_id`. Log a warning if the task doesn't exist."""
         self._log.trace(f"Cancelling task #{task_id}...")
 
+        if task_id in self._delayed:
+            _, coroutine = self._delayed.pop(task_id)
+
+            # Close it to prevent unawaited coroutine warnings, as it was never started.
+            self._log.debug(f"Explicitly closing the coroutine for #{task_id}.")
+            coroutine.close()
+
+            self._discard_cancelled_entries()
+            self._log.debug(f"Unscheduled task #{task_id} before it was due.")
+            return
+
         try:
             task = self._scheduled_tasks.pop(task_id)
         except KeyError:
@@ -102,29 +136,79 @@ class Scheduler:
         """Unschedule all known tasks."""
         self._log.debug("Unscheduling all tasks")
 
-        for task_id in self._scheduled_tasks.copy():
+        for task_id in [*self._delayed, *self._scheduled_tasks]:
             self.cancel(task_id)
 
-    async def _await_later(self, delay: t.Union[int, float], task_id: t.Hashable, coroutine: t.Coroutine) -> None:
-        """Await `coroutine` after the given `delay` number of seconds."""
-        try:
-            self._log.trace(f"Waiting {delay} seconds before awaiting coroutine for #{task_id}.")
-            await asyncio.sleep(delay)
+    def _reject_coroutine(self, task_id: t.Hashable, coroutine: t.Coroutine) -> bool:
+        """Close `coroutine` and return True if a task with `task_id` is already scheduled."""
+        msg = f"Cannot schedule an already started coroutine for #{task_id}"
+        assert inspect.getcoroutinestate(coroutine) == "CORO_CREATED", msg
+
+        if task_id in self:
+            self._log.debug(f"Did not schedule task #{task_id}; task was already scheduled.")
+            coroutine.close()
+            return True
+
+        return False
+
+    def _start_task(self, task_id: t.Hashable, coroutine: t.Coroutine) -> None:
+        """Create a task for `coroutine` and track it under `task_id`."""
+        task = asyncio.create_task(coroutine, name=f"{self.name}_{task_id}")
+        task.add_done_callback(partial(self._task_done_callback, task_id))
 
-            # Use asyncio.shield to prevent the coroutine from cancelling itself.
+        self._scheduled_tasks[task_id] = task
+        self._log.debug(f"Scheduled task #{task_id} {id(task)}.")
+
+    def _arm_timer(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Replace the timer with one for the earliest entry in the heap, if there is any."""
+        if self._timer:
+            self._timer.cancel()
+            self._timer = None
+
+        if self._heap:
+            self._timer = loop.call_at(self._heap[0][0], self._start_due_tasks)
+
+    def _start_due_tasks(self) -> None:
+        """Start the tasks of all delayed coroutines which are due and re-arm the timer for the next one."""
+        self._timer = None
+        loop = asyncio.get_running_loop()
+        # The loop runs timers which are due within its clock's resolution; treat those entries as due too.
+        end_time = loop.time() + CLOCK_RESOLUTION
+
+        while self._heap and self._heap[0][0] <= end_time:
+            _, sequence, task_id = heapq.heappop(self._heap)
+
+            delayed = self._delayed.get(task_id)
+            if delayed is None or delayed[0] != sequence:
+                continue  # The coroutine was cancelled.
+
+            del self._delayed[task_id]
             self._log.trace(f"Done waiting for #{task_id}; now awaiting the coroutine.")
-            await asyncio.shield(coroutine)
-        finally:
-            # Close it to prevent unawaited coroutine warnings,
-            # which would happen if the task was cancelled during the sleep.
-            # Only close it if it's not been awaited yet. This check is important because the
-            # coroutine may cancel this task, which would also trigger the finally block.
-            state = inspect.getcoroutinestate(coroutine)
-            if state == "CORO_CREATED":
-                self._log.debug(f"Explicitly closing the coroutine for #{task_id}.")
-                coroutine.close()
-            else:
-                self._log.debug(f"Finally block reached for #{task_id}; {state=}")
+            coroutine_task = asyncio.create_task(delayed[1], name=f"{self.name}_{task_id}_shielded")
+            self._start_task(task_id, self._await_shielded(coroutine_task))
+
+        self._arm_timer(loop)
+
+    def _discard_cancelled_entries(self) -> None:
+        """Rebuild the heap without the entries of cancelled coroutines once they make up most of it."""
+        if len(self._heap) <= 2 * len(self._delayed):
+            return
+
+        self._heap = [
+            entry for entry in self._heap
+            if entry[2] in self._delayed and self._delayed[entry[2]][0] == entry[1]
+        ]
+        heapq.heapify(self._heap)
+
+        if not self._heap and self._timer:
+            self._timer.cancel()
+            self._timer = None
+
+    @staticmethod
+    async def _await_shielded(task: asyncio.Task) -> None:
+        """Await `task` without it being cancelled when the awaiting task is cancelled."""
+        # Use asyncio.shield to prevent the coroutine from cancelling itself.
+        await asyncio.shield(task)
 
     def _task_done_callback(self, task_id: t.Hashable, done_task: asyncio.Task) -> None:
         """
@@ -1,6 +1,12 @@
+import asyncio
 import unittest
+from unittest import mock
 
+import discord
+
+from bot.constants import MODERATION_ROLES
 from bot.utils import messages
+from tests import helpers
 
 
 class TestMessages(unittest.TestCase):
@@ -25,3 +31,73 @@ class TestMessages(unittest.TestCase):
         for username_in, username_out in test_cases:
             with self.subTest(input=username_in, expected_output=username_out):
                 self.assertEqual(messages.sub_clyde(username_in), username_out)
+
+
+class ReactionCheckTests(unittest.IsolatedAsyncioTestCase):
+    """Tests for the `reaction_check` function."""
+
+    def setUp(self):
+        patcher = mock.patch("bot.instance", new=helpers.MockBot(user=helpers.MockMember(bot=True)))
+        self.bot = patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.message = helpers.MockMessage(id=1)
+        self.user = helpers.MockMember(id=2)
+        self.reaction = helpers.MockReaction(emoji="✅", message=self.message)
+        self.kwargs = dict(message_id=1, allowed_emoji=frozenset({"✅"}), allowed_users=frozenset({2}))
+
+    def test_reaction_check_allowed_user(self):
+        """Should return True for an allowed emoji by an allowed user on the right message."""
+        self.assertTrue(messages.reaction_check(self.reaction, self.user, **self.kwargs))
+        self.assertEqual(messages._pending_removals, {})
+
+    def test_reaction_check_custom_emoji(self):
+        """Should compare custom emoji by their string form."""
+        emoji = discord.PartialEmoji(name="custom", id=3)
+        reaction = helpers.MockReaction(emoji=emoji, message=self.message)
+        kwargs = {**self.kwargs, "allowed_emoji": frozenset({"<:custom:3>"})}
+
+        self.assertTrue(messages.reaction_check(reaction, self.user, **kwargs))
+        self.assertFalse(messages.reaction_check(reaction, self.user, **self.kwargs))
+
+    def test_reaction_check_ignored_reactions(self):
+        """Should return False without removing reactions on other messages, with other emoji, or by the bot."""
+        test_cases = (
+            ("other message", helpers.MockReaction(emoji="✅", message=helpers.MockMessage(id=3)), self.user),
+            ("other emoji", helpers.MockReaction(emoji="❌", message=self.message), self.user),
+            ("bot user", self.reaction, self.bot.user),
+        )
+
+        for name, reaction, user in test_cases:
+            with self.subTest(case=name):
+                self.assertFalse(messages.reaction_check(reaction, user, **self.kwargs))
+                self.assertEqual(messages._pending_removals, {})
+
+    async def test_reaction_check_moderator(self):
+        """Should allow moderators who aren't in `allowed_users` only if `allow_mods` is True."""
+        moderator = helpers.MockMember(id=4, roles=[helpers.MockRole(id=MODERATION_ROLES[0])])
+
+        self.assertTrue(messages.reaction_check(self.reaction, moderator, **self.kwargs))
+        self.assertFalse(messages.reaction_check(self.reaction, moderator, **self.kwargs, allow_mods=False))
+
+    async def test_reaction_check_user_without_roles(self):
+        """Should not treat users outside of a guild, who have no roles, as moderators."""
+        self.assertFalse(messages.reaction_check(self.reaction, helpers.MockUser(id=4), **self.kwargs))
+
+    @mock.patch("bot.utils.messages.REACTION_REMOVAL_DELAY", new=0)
+    async def test_reaction_check_disallowed_users(self):
+        """Should return False and remove the reactions of disallowed users with a single task per message."""
+        users = (helpers.MockMember(id=4), helpers.MockMember(id=5))
+
+        for user in users:
+            self.assertFalse(messages.reaction_check(self.reaction, user, **self.kwargs))
+
+        tasks = [task for task in asyncio.all_tasks() if task.get_name() == f"remove_reactions-{self.message.id}"]
+        self.assertEqual(len(tasks), 1)
+        await tasks[0]
+
+        self.assertEqual(
+            self.message.remove_reaction.await_args_list,
+            [mock.call("✅", user) for user in users]
+        )
+        self.assertEqual(messages._pending_removals, {})
@@ -0,0 +1,99 @@
+import asyncio
+import unittest
+from unittest import mock
+
+from bot.utils import scheduling
+
+
+class SchedulerTests(unittest.IsolatedAsyncioTestCase):
+    """Tests for the `Scheduler` class."""
+
+    def setUp(self):
+        self.scheduler = scheduling.Scheduler("test")
+        self.awaited = []
+
+    async def record(self, value: str) -> None:
+        """Append `value` to `self.awaited`."""
+        self.awaited.append(value)
+
+    async def test_schedule_starts_task_immediately(self):
+        """Should start a task right away and stop tracking it once it's done."""
+        self.scheduler.schedule("now", self.record("now"))
+        self.assertIn("now", self.scheduler)
+
+        await asyncio.sleep(0.01)
+        self.assertEqual(self.awaited, ["now"])
+        self.assertNotIn("now", self.scheduler)
+
+    async def test_schedule_later_awaits_in_order(self):
+        """Should await delayed coroutines in the order they're due, regardless of when they were scheduled."""
+        self.scheduler.schedule_later(0.03, "last", self.record("last"))
+        self.scheduler.schedule_later(0.01, "first", self.record("first"))
+        self.scheduler.schedule_later(0.02, "second", self.record("second"))
+        self.assertIn("last", self.scheduler)
+
+        await asyncio.sleep(0.015)
+        self.assertEqual(self.awaited, ["first"])
+
+        await asyncio.sleep(0.05)
+        self.assertEqual(self.awaited, ["first", "second", "last"])
+        self.assertNotIn("last", self.scheduler)
+
+    async def test_delayed_coroutines_share_one_timer(self):
+        """Should use a single event loop timer for all the delayed coroutines."""
+        loop = asyncio.get_running_loop()
+        with mock.patch.object(loop, "call_at", wraps=loop.call_at) as call_at:
+            for i in range(10):
+                self.scheduler.schedule_later(1 + i, i, self.record(str(i)))
+
+            call_at.assert_called_once()
+
+        self.scheduler.cancel_all()
+
+    async def test_duplicate_task_id_closes_coroutine(self):
+        """Should close the new coroutine if a task with the same ID is already scheduled."""
+        coroutine = self.record("duplicate")
+
+        self.scheduler.schedule_later(0.01, "id", self.record("original"))
+        self.scheduler.schedule("id", coroutine)
+
+        self.assertEqual(coroutine.cr_frame, None)  # A closed coroutine has no frame.
+        await asyncio.sleep(0.03)
+        self.assertEqual(self.awaited, ["original"])
+
+    async def test_cancel_delayed_coroutine(self):
+        """Should close a cancelled delayed coroutine and still await the others."""
+        coroutine = self.record("cancelled")
+        self.scheduler.schedule_later(0.01, "cancelled", coroutine)
+        self.scheduler.schedule_later(0.02, "kept", self.record("kept"))
+
+        self.scheduler.cancel("cancelled")
+        self.assertNotIn("cancelled", self.scheduler)
+        self.assertEqual(coroutine.cr_frame, None)
+
+        await asyncio.sleep(0.04)
+        self.assertEqual(self.awaited, ["kept"])
+
+    async def test_cancel_all(self):
+        """Should unschedule both running tasks and delayed coroutines, leaving no timer behind."""
+        self.scheduler.schedule("now", asyncio.sleep(1))
+        self.scheduler.schedule_later(1, "later", self.record("later"))
+
+        self.scheduler.cancel_all()
+        await asyncio.sleep(0)
+
+        self.assertNotIn("now", self.scheduler)
+        self.assertNotIn("later", self.scheduler)
+        self.assertIsNone(self.scheduler._timer)
+
+    async def test_delayed_coroutine_survives_cancelling_itself(self):
+        """Should not cancel a delayed coroutine which cancels its own task once started."""
+        async def cancel_self() -> None:
+            self.scheduler.cancel("self")
+            await asyncio.sleep(0)
+            self.awaited.append("self")
+
+        self.scheduler.schedule_later(0, "self", cancel_self())
+
+        await asyncio.sleep(0.01)
+        self.assertEqual(self.awaited, ["self"])